@@ -3,9 +3,53 @@ Agentic AI System for Collaborative Learning
 Implements three types of agents using template-based logic (simulating LLM inference)
 """
 
-from typing import List, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+# Milestone statuses that still have work outstanding
+_ACTIVE_STATUSES = frozenset({"In Progress", "Not Started"})
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD milestone date; the same few dates recur on every call."""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _individual_hours(group_contribs: Dict[str, List[Dict]], students: Optional[List[str]] = None) -> Dict[str, float]:
+    """Total contributed hours per student (defaults to every student with records)."""
+    if students is None:
+        students = group_contribs.keys()
+    return {s: sum(c["duration_hours"] for c in group_contribs.get(s, [])) for s in students}
+
+
+def _cached_hours(cache: Dict, group_id: str, group_contribs: Dict,
+                  students: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Per-student totals for a group, keyed on the identity of group_contribs and
+    students: changing them in place (e.g. appending a contribution) is not seen,
+    so treat the data as read-only, as get_all_data() does.
+    Entries keep a reference to the objects they were built from, so the
+    identity check cannot match a recycled object.
+    """
+    cached = cache.get(group_id)
+    if cached is None or cached[0] is not group_contribs or cached[1] is not students:
+        cached = (group_contribs, students, _individual_hours(group_contribs, students))
+        cache[group_id] = cached
+    return cached[2]
+
+
+# Returned when no other nudge applies; copied so callers may mutate their result
+_ALL_GOOD_NUDGE = MappingProxyType({
+    "icon": "✅",
+    "title": "All Good!",
+    "message": "You're on track. Keep collaborating with your team.",
+    "action": "Continue with current tasks"
+})
+
 # ============================================================================
 # PERSONAL AI ASSISTANT (Runs on Student Device - Edge)
 # ============================================================================
@@ -13,49 +57,57 @@ class PersonalAIAssistant:
     """
     Personal AI agent for individual students.
     Tracks own contributions and provides gentle nudges.
+    Hour totals are cached per group on the identity of the data passed in;
+    pass a new dict rather than changing the data in place.
     """
     
+    # Shared by every instance and read-only (inner templates included) so one copy
+    # serves all students; override by assigning nudge_templates on a subclass or instance
+    nudge_templates = MappingProxyType({
+        "inactivity": MappingProxyType({
+            "icon": "📢",
+            "title": "Time to Contribute!",
+            "message": "You haven't contributed this week. Your team might need help with {task}.",
+            "action": "Start with a 30-minute session on {task}"
+        }),
+        "communication": MappingProxyType({
+            "icon": "💬",
+            "title": "Communication Tip",
+            "message": "Your recent message was quite direct. Try framing as a question: \"{suggestion}\"",
+            "action": "Use collaborative language to encourage discussion"
+        }),
+        "role_mismatch": MappingProxyType({
+            "icon": "🔄",
+            "title": "Skills Alignment",
+            "message": "You're strong at {your_skill}, but mostly working on {current_task}. Consider {suggestion}.",
+            "action": "Explore leveraging your {your_skill} skills"
+        }),
+        "good_work": MappingProxyType({
+            "icon": "⭐",
+            "title": "Great Progress!",
+            "message": "You've contributed {hours} hours this week - keep up the momentum!",
+            "action": "Consider documenting your work"
+        }),
+        "deadline_approaching": MappingProxyType({
+            "icon": "⏰",
+            "title": "Milestone Approaching",
+            "message": "{milestone} is due on {date}. Current task: {task}",
+            "action": "Check milestone progress and coordinate with team"
+        })
+    })
+    
     def __init__(self):
-        self.nudge_templates = {
-            "inactivity": {
-                "icon": "📢",
-                "title": "Time to Contribute!",
-                "message": "You haven't contributed this week. Your team might need help with {task}.",
-                "action": "Start with a 30-minute session on {task}"
-            },
-            "communication": {
-                "icon": "💬",
-                "title": "Communication Tip",
-                "message": "Your recent message was quite direct. Try framing as a question: \"{suggestion}\"",
-                "action": "Use collaborative language to encourage discussion"
-            },
-            "role_mismatch": {
-                "icon": "🔄",
-                "title": "Skills Alignment",
-                "message": "You're strong at {your_skill}, but mostly working on {current_task}. Consider {suggestion}.",
-                "action": "Explore leveraging your {your_skill} skills"
-            },
-            "good_work": {
-                "icon": "⭐",
-                "title": "Great Progress!",
-                "message": "You've contributed {hours} hours this week - keep up the momentum!",
-                "action": "Consider documenting your work"
-            },
-            "deadline_approaching": {
-                "icon": "⏰",
-                "title": "Milestone Approaching",
-                "message": "{milestone} is due on {date}. Current task: {task}",
-                "action": "Check milestone progress and coordinate with team"
-            }
-        }
+        self._hours_cache = {}
     
     def generate_nudges(self, student: str, group_id: str, data: Dict) -> List[Dict[str, str]]:
         """Generate personalized nudges for a student."""
         nudges = []
+        now = datetime.now()
         
         contributions = data["contributions"].get(group_id, {}).get(student, [])
         group_contribs = data["contributions"].get(group_id, {})
-        total_hours = sum(c["duration_hours"] for c in contributions)
+        all_contrib_hours = _cached_hours(self._hours_cache, group_id, group_contribs)
+        total_hours = all_contrib_hours.get(student, 0)
         
         # Check for inactivity
         if not contributions:
@@ -66,10 +118,9 @@ class PersonalAIAssistant:
                 "action": "Check with your group about task assignments"
             })
         elif len(contributions) > 0:
-            last_contrib = max([c["date"] for c in contributions])
-            days_since = (datetime.now() - last_contrib).days
+            last_contrib = max(c["date"] for c in contributions)
+            days_since = (now - last_contrib).days
             if days_since >= 3:
-                tasks = list(set(c["task"] for c in contributions))
                 nudges.append({
                     "icon": self.nudge_templates["inactivity"]["icon"],
                     "title": self.nudge_templates["inactivity"]["title"],
@@ -77,20 +128,20 @@ class PersonalAIAssistant:
                     "action": "Catch up on project progress and rejoin"
                 })
         
-        # Check participation balance
-        all_contrib_hours = {s: sum(c["duration_hours"] for c in group_contribs.get(s, []))
-                            for s in group_contribs.keys()}
-        max_hours = max(all_contrib_hours.values()) if all_contrib_hours else 0
-        avg_hours = sum(all_contrib_hours.values()) / len(all_contrib_hours) if all_contrib_hours else 0
-        
-        if max_hours > 0 and total_hours < avg_hours * 0.5:
-            nudges.append({
-                "icon": "⚖️",
-                "title": "Ensure Fair Load",
-                "message": f"You've contributed {total_hours} hours while others are doing more. "
-                          f"Consider taking on additional tasks?",
-                "action": "Discuss workload distribution with team"
-            })
+        # Check participation balance (nothing to compare in a group with no records yet)
+        if all_contrib_hours:
+            group_total = sum(all_contrib_hours.values())
+            avg_hours = group_total / len(all_contrib_hours)
+            
+            # Hours are non-negative, so a positive total means someone has contributed
+            if group_total > 0 and total_hours < avg_hours * 0.5:
+                nudges.append({
+                    "icon": "⚖️",
+                    "title": "Ensure Fair Load",
+                    "message": f"You've contributed {total_hours} hours while others are doing more. "
+                              f"Consider taking on additional tasks?",
+                    "action": "Discuss workload distribution with team"
+                })
         
         # Positive reinforcement
         if total_hours >= 5:
@@ -103,24 +154,17 @@ class PersonalAIAssistant:
         
         # Deadline check
         milestones = data["milestones"].get(group_id, [])
-        upcoming = [m for m in milestones if m["status"] == "In Progress" or m["status"] == "Not Started"]
+        upcoming = next((m for m in milestones if m["status"] in _ACTIVE_STATUSES), None)
         if upcoming:
             nudges.append({
                 "icon": self.nudge_templates["deadline_approaching"]["icon"],
                 "title": self.nudge_templates["deadline_approaching"]["title"],
-                "message": f"'{upcoming[0]['name']}' is due {upcoming[0]['due_date']}. "
-                          f"Current status: {upcoming[0]['status']}",
+                "message": f"'{upcoming['name']}' is due {upcoming['due_date']}. "
+                          f"Current status: {upcoming['status']}",
                 "action": "Coordinate timing with your team"
             })
         
-        return nudges if nudges else [
-            {
-                "icon": "✅",
-                "title": "All Good!",
-                "message": "You're on track. Keep collaborating with your team.",
-                "action": "Continue with current tasks"
-            }
-        ]
+        return nudges if nudges else [dict(_ALL_GOOD_NUDGE)]
 
 # ============================================================================
 # GROUP AI FACILITATOR (Team-Level Coordination)
@@ -128,10 +172,13 @@ class PersonalAIAssistant:
 class GroupAIFacilitator:
     """
     Group-level AI agent that analyzes team dynamics and facilitates collaboration.
+    Hour totals are cached per group on the identity of the data passed in;
+    pass a new dict rather than changing the data in place.
     """
     
     def __init__(self):
         self.imbalance_threshold = 0.6  # If one person does >60%, flag it
+        self._hours_cache = {}
     
     def analyze_group(self, group_id: str, data: Dict) -> Dict[str, Any]:
         """Comprehensive group analysis."""
@@ -146,35 +193,44 @@ class GroupAIFacilitator:
         students = data["groups"][group_id]["students"]
         
         # Calculate contribution metrics
-        total_hours = 0
-        individual_hours = {}
-        
-        for student in students:
-            hours = sum(c["duration_hours"] for c in contributions.get(student, []))
-            individual_hours[student] = hours
-            total_hours += hours
+        individual_hours = _cached_hours(self._hours_cache, group_id, contributions, students)
+        total_hours = sum(individual_hours.values())
         
         analysis["metrics"]["total_hours"] = total_hours
-        analysis["metrics"]["individual_hours"] = individual_hours
+        analysis["metrics"]["individual_hours"] = dict(individual_hours)
         analysis["metrics"]["avg_hours"] = total_hours / len(students) if students else 0
-        analysis["metrics"]["participation_rate"] = len([h for h in individual_hours.values() if h > 0]) / len(students)
+        analysis["metrics"]["participation_rate"] = self._participation_rate(individual_hours, students)
         
         return analysis
     
+    def participation_rate(self, group_id: str, data: Dict) -> float:
+        """Fraction of the group's students who have contributed at all."""
+        contributions = data["contributions"].get(group_id, {})
+        students = data["groups"][group_id]["students"]
+        individual_hours = _cached_hours(self._hours_cache, group_id, contributions, students)
+        return self._participation_rate(individual_hours, students)
+    
+    @staticmethod
+    def _participation_rate(individual_hours: Dict[str, float], students: List[str]) -> float:
+        return sum(1 for h in individual_hours.values() if h > 0) / len(students)
+    
     def detect_imbalances(self, group_id: str, data: Dict) -> List[Dict[str, str]]:
         """Detect participation imbalances and potential issues."""
         alerts = []
+        now = datetime.now()
         
         contributions = data["contributions"].get(group_id, {})
         students = data["groups"][group_id]["students"]
         
-        individual_hours = {s: sum(c["duration_hours"] for c in contributions.get(s, []))
-                           for s in students}
+        individual_hours = _cached_hours(self._hours_cache, group_id, contributions, students)
         total_hours = sum(individual_hours.values())
         
-        # Find overloaded students
+        # Find overloaded and inactive students in a single sweep
+        inactive = []
         for student, hours in individual_hours.items():
-            if total_hours > 0:
+            if hours == 0:
+                inactive.append(student)
+            elif total_hours > 0:
                 percentage = hours / total_hours
                 if percentage > self.imbalance_threshold:
                     alerts.append({
@@ -184,8 +240,6 @@ class GroupAIFacilitator:
                                   f"Consider redistributing tasks for better balance."
                     })
         
-        # Find inactive students
-        inactive = [s for s, h in individual_hours.items() if h == 0]
         if inactive:
             alerts.append({
                 "severity": "high",
@@ -195,12 +249,12 @@ class GroupAIFacilitator:
         
         # Check milestone progress
         milestones = data["milestones"].get(group_id, [])
-        overdue = [m for m in milestones if m["status"] == "Not Started" and 
-                  datetime.strptime(m["due_date"], "%Y-%m-%d") < datetime.now()]
+        overdue = next((m for m in milestones if m["status"] == "Not Started" and
+                        _parse_date(m["due_date"]) < now), None)
         if overdue:
             alerts.append({
                 "severity": "high",
-                "message": f"🔴 Milestone '{overdue[0]['name']}' is overdue. Urgent: catch up required."
+                "message": f"🔴 Milestone '{overdue['name']}' is overdue. Urgent: catch up required."
             })
         
         # Check for communication issues
@@ -222,17 +276,22 @@ class GroupAIFacilitator:
         contributions = data["contributions"].get(group_id, {})
         students = data["groups"][group_id]["students"]
         
-        individual_hours = {s: sum(c["duration_hours"] for c in contributions.get(s, []))
-                           for s in students}
+        individual_hours = _cached_hours(self._hours_cache, group_id, contributions, students)
         
-        # Find overloaded and underutilized
-        overloaded = [s for s, h in individual_hours.items() if h > 5]
-        underutilized = [s for s, h in individual_hours.items() if h < 2]
+        # Find the first overloaded and underutilized students, stopping once both are known
+        overloaded = underutilized = None
+        for student, hours in individual_hours.items():
+            if overloaded is None and hours > 5:
+                overloaded = student
+            elif underutilized is None and hours < 2:
+                underutilized = student
+            if overloaded is not None and underutilized is not None:
+                break
         
-        if overloaded and underutilized:
+        if overloaded is not None and underutilized is not None:
             suggestions.append({
                 "type": "rebalance",
-                "message": f"Move some tasks from {overloaded[0]} to {underutilized[0]} for better balance.",
+                "message": f"Move some tasks from {overloaded} to {underutilized} for better balance.",
                 "rationale": "Improves team equity and engagement"
             })
         
@@ -245,10 +304,14 @@ class InstructorDashboard:
     """
     Instructor-level AI agent that provides high-level alerts and recommendations.
     Filters noise and only alerts on critical issues.
+    Its facilitator caches hour totals on the identity of the data passed in;
+    pass a new dict rather than changing the data in place.
     """
     
-    def __init__(self):
+    def __init__(self, facilitator: Optional[GroupAIFacilitator] = None):
         self.alert_threshold = 0.5  # Only alert if >50% of team is inactive
+        # Share the app's facilitator when given so both views reuse one hour memo
+        self.facilitator = facilitator if facilitator is not None else GroupAIFacilitator()
     
     def generate_alerts(self, data: Dict) -> List[Dict[str, str]]:
         """Generate critical alerts for instructor attention."""
@@ -278,8 +341,7 @@ class InstructorDashboard:
     
     def get_group_alerts(self, group_id: str, data: Dict) -> List[Dict[str, str]]:
         """Get all alerts for a specific group."""
-        facilitator = GroupAIFacilitator()
-        return facilitator.detect_imbalances(group_id, data)
+        return self.facilitator.detect_imbalances(group_id, data)
     
     def get_recommendations(self, data: Dict) -> List[Dict[str, str]]:
         """Get actionable recommendations for instructor."""
@@ -294,15 +356,14 @@ class InstructorDashboard:
                     "impact": "High - Could improve group success rate"
                 })
         
-        # Check for patterns
-        facilitator = GroupAIFacilitator()
-        all_analyses = {
-            gid: facilitator.analyze_group(gid, data)
+        # Check for patterns (only participation is needed, so skip the full analyses)
+        participation_rates = [
+            self.facilitator.participation_rate(gid, data)
             for gid in data["groups"].keys()
-        }
+        ]
         
         # If overall participation is low
-        avg_participation = sum(a["metrics"]["participation_rate"] for a in all_analyses.values()) / len(all_analyses)
+        avg_participation = sum(participation_rates) / len(participation_rates)
         if avg_participation < 0.8:
             recommendations.append({
                 "title": "Course-Wide Engagement",
@@ -315,11 +376,12 @@ class InstructorDashboard:
     
     def generate_summary(self, data: Dict) -> Dict[str, Any]:
         """Generate executive summary for instructor."""
+        status_counts = Counter(g["status"] for g in data["groups"].values())
         summary = {
             "total_groups": len(data["groups"]),
-            "thriving": sum(1 for g in data["groups"].values() if g["status"] == "Thriving"),
-            "healthy": sum(1 for g in data["groups"].values() if g["status"] == "Healthy"),
-            "at_risk": sum(1 for g in data["groups"].values() if g["status"] == "At Risk"),
+            "thriving": status_counts["Thriving"],
+            "healthy": status_counts["Healthy"],
+            "at_risk": status_counts["At Risk"],
             "total_alerts": len(self.generate_alerts(data)),
             "recommendations": len(self.get_recommendations(data))
         }
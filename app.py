@@ -12,6 +12,7 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from collections import Counter
 from datetime import datetime, timedelta
 from sample_data import get_all_data
 from agentic_system import (
@@ -37,23 +38,151 @@ This POC demonstrates how AI agents at different levels (personal, group, instit
 can enhance student collaboration while maintaining privacy and reducing instructor overhead.
 """)
 
+# Display helpers and per-load aggregates
+# Color-coded display label per group status; anything else is shown as at risk
+STATUS_LABEL = {"Thriving": "🟢 Thriving", "Healthy": "🟡 Healthy", "At Risk": "🔴 At Risk"}
+MILESTONE_ICON = {"Completed": "✅", "In Progress": "⏳"}
+
+def render_milestones(milestones):
+    """One markdown block listing every milestone, so the view emits a single element."""
+    return "\n\n".join(
+        f"{MILESTONE_ICON.get(m['status'], '⭕')} **{m['name']}** - {m['status']} (Due: {m['due_date']})"
+        for m in milestones
+    )
+
+def render_communications(comms):
+    """One markdown block for the last 3 messages, sender and tone in muted text."""
+    return "\n\n".join(
+        f":gray[**{c['from']} → {c['to']}** ({c['date']})]\n\n> {c['message']}\n\n:gray[Tone: {c['tone']}]"
+        for c in comms[-3:]
+    )
+
+def build_aggregates(data):
+    """Per-student totals and view tables derived once per data load, shared by every view."""
+    # Long-form table with one row per contribution, so aggregates run in pandas
+    contributions_df = pd.DataFrame.from_records(
+        [(group_id, student, c["date"], c["task"], c["action"], c["duration_hours"])
+         for group_id, contributions in data["contributions"].items()
+         for student, actions in contributions.items()
+         for c in actions],
+        columns=["group_id", "student", "date", "task", "action", "duration_hours"]
+    ).astype({"duration_hours": "float64"})
+    
+    # Hours per (group_id, student), including students whose contribution list is empty
+    student_keys = pd.MultiIndex.from_tuples(
+        [(group_id, student)
+         for group_id, contributions in data["contributions"].items()
+         for student in contributions],
+        names=["group_id", "student"]
+    )
+    by_student = contributions_df.groupby(["group_id", "student"], sort=False)
+    student_hours = by_student["duration_hours"].sum().reindex(student_keys, fill_value=0.0)
+    
+    # Tables are built with known columns and dtypes, once per load
+    participation_df = pd.DataFrame({
+        "Group": [data["groups"][group_id]["name"] for group_id, _ in student_keys],
+        "Student": student_keys.get_level_values("student"),
+        "Hours": student_hours.to_numpy()
+    })
+    palette = px.colors.qualitative.Plotly
+    group_colors = {g["name"]: palette[i % len(palette)] for i, g in enumerate(data["groups"].values())}
+    participation_colors = participation_df["Group"].map(group_colors).to_numpy()
+    
+    group_participation = {}
+    for group_id, group_info in data["groups"].items():
+        group_participation[group_id] = pd.DataFrame.from_records(
+            [(student, student_hours.get((group_id, student), 0.0)) for student in group_info["students"]],
+            columns=["Student", "Hours"]
+        ).astype({"Hours": "float64"})
+    
+    health_df = pd.DataFrame.from_records(
+        [(g["name"], g["project"], g["status"], len(g["students"]), g["deadline"])
+         for g in data["groups"].values()],
+        columns=["Group", "Project", "Status", "Students", "Deadline"]
+    )
+    health_df["Status"] = health_df["Status"].map(STATUS_LABEL).fillna("🔴 " + health_df["Status"])
+    
+    # student -> (group_id, group name); the first group listing a student wins
+    student_index = {}
+    for group_id, group_info in data["groups"].items():
+        for student in group_info["students"]:
+            student_index.setdefault(student, (group_id, group_info["name"]))
+    
+    return {
+        "milestones_md": {gid: render_milestones(data["milestones"].get(gid, [])) for gid in data["groups"]},
+        "communications_md": {gid: render_communications(data["communications"].get(gid, []))
+                              for gid in data["groups"]},
+        "contributions_df": contributions_df,
+        # Students with at least one contribution record
+        "active_contributors": by_student.ngroups,
+        # (group_id, student) -> row positions in contributions_df, in record order
+        "student_rows": by_student.indices,
+        "student_index": student_index,
+        "student_hours": student_hours,
+        "participation_df": participation_df,
+        "participation_colors": participation_colors,
+        "group_participation": group_participation,
+        "health_df": health_df
+    }
+
 # Load data
-@st.cache_data
+# Shared by reference across reruns and sessions (no per-rerun copy); treat as read-only
+@st.cache_resource
 def load_data():
-    return get_all_data()
+    data = get_all_data()
+    return data, build_aggregates(data)
 
-data = load_data()
+data, aggregates = load_data()
 
 # Initialize agents
 @st.cache_resource
 def init_agents():
     personal_assistant = PersonalAIAssistant()
     group_facilitator = GroupAIFacilitator()
-    instructor_dashboard = InstructorDashboard()
+    instructor_dashboard = InstructorDashboard(facilitator=group_facilitator)
     return personal_assistant, group_facilitator, instructor_dashboard
 
 personal_ai, group_ai, instructor_ai = init_agents()
 
+# Figures are built once per process and shared by reference (st.cache_data would
+# unpickle, i.e. rebuild, the figure on every hit; st.plotly_chart only reads it).
+# The aggregates they draw are loaded once (see load_data), so they are left out of
+# the cache key (leading underscore).
+# Columns go in as numpy arrays so plotly can serialize them without per-item conversion.
+@st.cache_resource
+def build_participation_figure(_aggregates):
+    part_df = _aggregates["participation_df"]
+    # One bar trace colored per group, rather than px.bar's trace-per-group split;
+    # the multicategory x-axis labels each group under its students' bars
+    fig = go.Figure(data=[
+        go.Bar(x=[part_df["Group"].to_numpy(), part_df["Student"].to_numpy()], y=part_df["Hours"].to_numpy(),
+               marker_color=_aggregates["participation_colors"],
+               customdata=part_df[["Student", "Group"]].to_numpy(),
+               hovertemplate="%{customdata[0]} (%{customdata[1]})<br>Hours: %{y}<extra></extra>")
+    ])
+    fig.update_layout(
+        title="Hours Contributed by Student (Last 2 Weeks)",
+        xaxis_title="Student",
+        yaxis_title="Hours"
+    )
+    return fig
+
+@st.cache_resource
+def build_group_figure(group_id, _aggregates):
+    part_df = _aggregates["group_participation"][group_id]
+    hours = part_df["Hours"].to_numpy()
+    fig = go.Figure(data=[
+        go.Bar(x=part_df["Student"].to_numpy(), y=hours,
+               marker_color=['#1f77b4' if h > 0 else '#ff7f0e' for h in hours])
+    ])
+    fig.update_layout(
+        title="Hours Contributed by Team Member",
+        xaxis_title="Student",
+        yaxis_title="Hours",
+        height=400
+    )
+    return fig
+
 # Sidebar Navigation
 st.sidebar.title("📋 Navigation")
 view = st.sidebar.radio(
@@ -92,64 +221,22 @@ if view == "🎯 Dashboard Overview":
     with col2:
         st.metric("Total Students", sum(len(g["students"]) for g in data["groups"].values()))
     with col3:
-        st.metric("Active Contributions", sum(
-            len([c for c in contributions if contributions[c]])
-            for contributions in data["contributions"].values()
-        ))
+        st.metric("Active Contributions", aggregates["active_contributors"])
     
     st.divider()
     
     # Group Health Summary
     st.subheader("Group Health Summary")
-    health_data = []
-    for group_id, group_info in data["groups"].items():
-        health_data.append({
-            "Group": group_info["name"],
-            "Project": group_info["project"],
-            "Status": group_info["status"],
-            "Students": len(group_info["students"]),
-            "Deadline": group_info["deadline"]
-        })
-    
-    health_df = pd.DataFrame(health_data)
-    
-    # Color code by status
-    def status_color(status):
-        if status == "Thriving":
-            return "🟢"
-        elif status == "Healthy":
-            return "🟡"
-        else:
-            return "🔴"
     
-    health_df["Status"] = health_df["Status"].apply(lambda x: f"{status_color(x)} {x}")
+    # Prebuilt at load time, with the status already color coded
+    health_df = aggregates["health_df"]
     
     st.dataframe(health_df, use_container_width=True, hide_index=True)
     
     # Participation Distribution Chart
     st.subheader("Participation Distribution (Last 2 Weeks)")
     
-    participation_data = []
-    for group_id, contributions in data["contributions"].items():
-        for student, actions in contributions.items():
-            total_hours = sum(a["duration_hours"] for a in actions)
-            participation_data.append({
-                "Group": data["groups"][group_id]["name"],
-                "Student": student,
-                "Hours": total_hours
-            })
-    
-    part_df = pd.DataFrame(participation_data)
-    
-    fig = px.bar(
-        part_df,
-        x="Student",
-        y="Hours",
-        color="Group",
-        title="Hours Contributed by Student (Last 2 Weeks)",
-        barmode="group"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_participation_figure(aggregates), use_container_width=True)
 
 # ============================================================================
 # VIEW 2: STUDENT ASSISTANT
@@ -159,20 +246,16 @@ elif view == "👤 Student Assistant":
     st.markdown("*Simulates an AI agent running on a student's device (Edge)*")
     
     # Student selection
-    all_students = []
-    for group_id, group_info in data["groups"].items():
-        for student in group_info["students"]:
-            all_students.append((student, group_id, group_info["name"]))
+    student_index = aggregates["student_index"]
     
     selected_student = st.selectbox(
         "Select Your Profile",
-        options=[s[0] for s in all_students],
+        options=list(student_index),
         format_func=lambda x: f"{x}"
     )
     
     # Find student's group
-    student_group = next((s[1] for s in all_students if s[0] == selected_student), None)
-    student_group_name = next((s[2] for s in all_students if s[0] == selected_student), None)
+    student_group, student_group_name = student_index.get(selected_student, (None, None))
     
     if student_group:
         st.info(f"👥 **Group:** {student_group_name}")
@@ -183,19 +266,24 @@ elif view == "👤 Student Assistant":
         # Personal Dashboard
         st.subheader("Your Contribution Dashboard")
         
-        # Get student's contributions
-        student_contribs = data["contributions"].get(student_group, {}).get(selected_student, [])
+        # Get student's contributions: one positional slice serves every metric below
+        contributions_df = aggregates["contributions_df"]
+        student_rows = aggregates["student_rows"].get((student_group, selected_student), [])
+        student_contribs = contributions_df.iloc[student_rows]
+        has_contribs = not student_contribs.empty
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Hours", sum(c["duration_hours"] for c in student_contribs))
+            total_hours = aggregates["student_hours"].get((student_group, selected_student), 0.0)
+            # Whole totals shown as ints, like the history table below
+            st.metric("Total Hours", int(total_hours) if total_hours.is_integer() else total_hours)
         with col2:
             st.metric("Tasks Completed", len(student_contribs))
         with col3:
             st.metric("Last Activity", 
-                     student_contribs[-1]["date"].strftime("%m-%d") if student_contribs else "None")
+                     student_contribs["date"].max().strftime("%m-%d") if has_contribs else "None")
         with col4:
-            st.metric("Status", "✅ Active" if student_contribs else "⚠️ Inactive")
+            st.metric("Status", "✅ Active" if has_contribs else "⚠️ Inactive")
         
         st.divider()
         
@@ -222,9 +310,14 @@ elif view == "👤 Student Assistant":
         
         # Contribution History
         st.subheader("Your Contribution History")
-        if student_contribs:
-            contrib_df = pd.DataFrame(student_contribs)
-            contrib_df['date'] = pd.to_datetime(contrib_df['date']).dt.strftime('%Y-%m-%d %H:%M')
+        if has_contribs:
+            # Hours are float64 in the long-form table; show them as whole numbers when they all
+            # are, as a per-student table of the raw records would
+            hours = student_contribs["duration_hours"]
+            if hours.mod(1).eq(0).all():
+                hours = hours.astype("int64")
+            contrib_df = student_contribs.assign(date=lambda df: df["date"].dt.strftime('%Y-%m-%d %H:%M'),
+                                                 duration_hours=hours)
             st.dataframe(contrib_df[['date', 'task', 'action', 'duration_hours']], 
                         use_container_width=True, hide_index=True)
         else:
@@ -238,11 +331,10 @@ elif view == "👥 Group Facilitator":
     st.markdown("*Analyzes group-level metrics and dynamics*")
     
     # Group selection
-    group_options = [(gid, g["name"]) for gid, g in data["groups"].items()]
     selected_group = st.selectbox(
         "Select Group",
-        options=[g[0] for g in group_options],
-        format_func=lambda x: next(g[1] for g in group_options if g[0] == x)
+        options=list(data["groups"]),
+        format_func=lambda x: data["groups"][x]["name"]
     )
     
     group_info = data["groups"][selected_group]
@@ -266,27 +358,7 @@ elif view == "👥 Group Facilitator":
     # Participation Balance
     st.subheader("Participation Balance Analysis")
     
-    participation = []
-    for student in group_info["students"]:
-        hours = sum(
-            c["duration_hours"] 
-            for c in data["contributions"].get(selected_group, {}).get(student, [])
-        )
-        participation.append({"Student": student, "Hours": hours})
-    
-    part_df = pd.DataFrame(participation)
-    
-    fig = go.Figure(data=[
-        go.Bar(x=part_df["Student"], y=part_df["Hours"], 
-               marker_color=['#1f77b4' if h > 0 else '#ff7f0e' for h in part_df["Hours"]])
-    ])
-    fig.update_layout(
-        title="Hours Contributed by Team Member",
-        xaxis_title="Student",
-        yaxis_title="Hours",
-        height=400
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_group_figure(selected_group, aggregates), use_container_width=True)
     
     # Imbalance Detection
     st.subheader("🔍 Group Health Analysis")
@@ -309,12 +381,8 @@ elif view == "👥 Group Facilitator":
     # Milestone Tracking
     st.subheader("📅 Milestone Progress")
     
-    milestones = data["milestones"].get(selected_group, [])
-    for milestone in milestones:
-        status_icon = "✅" if milestone["status"] == "Completed" else (
-            "⏳" if milestone["status"] == "In Progress" else "⭕"
-        )
-        st.write(f"{status_icon} **{milestone['name']}** - {milestone['status']} (Due: {milestone['due_date']})")
+    if aggregates["milestones_md"][selected_group]:
+        st.markdown(aggregates["milestones_md"][selected_group])
     
     st.divider()
     
@@ -324,10 +392,7 @@ elif view == "👥 Group Facilitator":
     comms = data["communications"].get(selected_group, [])
     if comms:
         st.info(f"📊 {len(comms)} messages analyzed")
-        for comm in comms[-3:]:  # Last 3
-            st.caption(f"**{comm['from']} → {comm['to']}** ({comm['date']})")
-            st.write(f"> {comm['message']}")
-            st.caption(f"Tone: {comm['tone']}")
+        st.markdown(aggregates["communications_md"][selected_group])
     else:
         st.info("No communications recorded yet")
 
@@ -348,10 +413,8 @@ elif view == "📊 Instructor Dashboard":
         total_students = sum(len(g["students"]) for g in data["groups"].values())
         st.metric("Students", total_students)
     with col3:
-        thriving = sum(1 for g in data["groups"].values() if g["status"] == "Thriving")
-        healthy = sum(1 for g in data["groups"].values() if g["status"] == "Healthy")
-        at_risk = sum(1 for g in data["groups"].values() if g["status"] == "At Risk")
-        st.metric("At Risk Groups", at_risk)
+        status_counts = Counter(g["status"] for g in data["groups"].values())
+        st.metric("At Risk Groups", status_counts["At Risk"])
     with col4:
         st.metric("Course End", "2024-12-20")
     
@@ -390,7 +453,9 @@ elif view == "📊 Instructor Dashboard":
             "Issues": len(group_alerts)
         })
     
-    status_df = pd.DataFrame(status_data)
+    status_df = pd.DataFrame.from_records(
+        status_data, columns=["Group", "Project", "Status", "Students", "Issues"]
+    )
     
     # Highlight by status
     def highlight_status(val):
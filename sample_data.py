@@ -5,6 +5,7 @@ Simulates a 3-group course project scenario with student contributions
 
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from random import random, choice, randint
 
 # Define 3 groups with 4 students each
@@ -40,128 +41,149 @@ TASK_CATEGORIES = {
 }
 
 # Contribution events (last 2 weeks)
-def generate_contributions():
-    contributions = {}
-    base_date = datetime.now() - timedelta(days=14)
-    
+# group -> student -> (day offset, hour of day, task, action, duration_hours)
+CONTRIBUTION_EVENTS = {
     # Group A - Imbalanced (At Risk)
-    contributions["Group_A"] = {
+    "Group_A": {
         "Alice": [
-            {"date": base_date + timedelta(days=0, hours=14), "task": "Frontend", "action": "Committed code", "duration_hours": 2},
-            {"date": base_date + timedelta(days=1, hours=10), "task": "Frontend", "action": "Reviewed PR", "duration_hours": 1},
-            {"date": base_date + timedelta(days=3, hours=15), "task": "Frontend", "action": "Fixed bugs", "duration_hours": 3},
-            {"date": base_date + timedelta(days=5, hours=9), "task": "Frontend", "action": "Updated component", "duration_hours": 2},
-            {"date": base_date + timedelta(days=7, hours=11), "task": "Frontend", "action": "Completed feature", "duration_hours": 4},
-            {"date": base_date + timedelta(days=10, hours=16), "task": "Frontend", "action": "Code review", "duration_hours": 1.5},
-            {"date": base_date + timedelta(days=12, hours=13), "task": "Frontend", "action": "Merged PR", "duration_hours": 1},
+            (0, 14, "Frontend", "Committed code", 2),
+            (1, 10, "Frontend", "Reviewed PR", 1),
+            (3, 15, "Frontend", "Fixed bugs", 3),
+            (5, 9, "Frontend", "Updated component", 2),
+            (7, 11, "Frontend", "Completed feature", 4),
+            (10, 16, "Frontend", "Code review", 1.5),
+            (12, 13, "Frontend", "Merged PR", 1),
         ],
         "Bob": [
-            {"date": base_date + timedelta(days=1, hours=14), "task": "Backend", "action": "Designed API", "duration_hours": 3},
-            {"date": base_date + timedelta(days=4, hours=10), "task": "Backend", "action": "Implemented endpoint", "duration_hours": 4},
-            {"date": base_date + timedelta(days=8, hours=15), "task": "Backend", "action": "Fixed issues", "duration_hours": 2},
-            {"date": base_date + timedelta(days=11, hours=9), "task": "Backend", "action": "Deployed", "duration_hours": 1},
+            (1, 14, "Backend", "Designed API", 3),
+            (4, 10, "Backend", "Implemented endpoint", 4),
+            (8, 15, "Backend", "Fixed issues", 2),
+            (11, 9, "Backend", "Deployed", 1),
         ],
         "Charlie": [
-            {"date": base_date + timedelta(days=2, hours=14), "task": "Database", "action": "Created schema", "duration_hours": 2},
+            (2, 14, "Database", "Created schema", 2),
         ],
         "Diana": []  # No contributions yet
-    }
-    
+    },
     # Group B - Balanced (Healthy)
-    contributions["Group_B"] = {
+    "Group_B": {
         "Eve": [
-            {"date": base_date + timedelta(days=0, hours=10), "task": "Data Collection", "action": "Scraped data", "duration_hours": 3},
-            {"date": base_date + timedelta(days=3, hours=14), "task": "Analysis", "action": "Cleaned dataset", "duration_hours": 2},
-            {"date": base_date + timedelta(days=7, hours=11), "task": "Visualization", "action": "Created charts", "duration_hours": 2.5},
+            (0, 10, "Data Collection", "Scraped data", 3),
+            (3, 14, "Analysis", "Cleaned dataset", 2),
+            (7, 11, "Visualization", "Created charts", 2.5),
         ],
         "Frank": [
-            {"date": base_date + timedelta(days=1, hours=15), "task": "Data Collection", "action": "Gathered sources", "duration_hours": 2},
-            {"date": base_date + timedelta(days=4, hours=10), "task": "Analysis", "action": "Statistical test", "duration_hours": 3},
-            {"date": base_date + timedelta(days=9, hours=13), "task": "Report Writing", "action": "Drafted section", "duration_hours": 2},
+            (1, 15, "Data Collection", "Gathered sources", 2),
+            (4, 10, "Analysis", "Statistical test", 3),
+            (9, 13, "Report Writing", "Drafted section", 2),
         ],
         "Grace": [
-            {"date": base_date + timedelta(days=2, hours=11), "task": "Analysis", "action": "Data profiling", "duration_hours": 2.5},
-            {"date": base_date + timedelta(days=5, hours=14), "task": "Visualization", "action": "Dashboard design", "duration_hours": 3},
-            {"date": base_date + timedelta(days=10, hours=10), "task": "Report Writing", "action": "Finalized report", "duration_hours": 1.5},
+            (2, 11, "Analysis", "Data profiling", 2.5),
+            (5, 14, "Visualization", "Dashboard design", 3),
+            (10, 10, "Report Writing", "Finalized report", 1.5),
         ],
         "Henry": [
-            {"date": base_date + timedelta(days=3, hours=13), "task": "Analysis", "action": "Correlation analysis", "duration_hours": 2},
-            {"date": base_date + timedelta(days=6, hours=15), "task": "Presentation", "action": "Created slides", "duration_hours": 3},
-            {"date": base_date + timedelta(days=11, hours=9), "task": "Report Writing", "action": "Peer review", "duration_hours": 1},
+            (3, 13, "Analysis", "Correlation analysis", 2),
+            (6, 15, "Presentation", "Created slides", 3),
+            (11, 9, "Report Writing", "Peer review", 1),
         ]
-    }
-    
+    },
     # Group C - Excellent (Thriving)
-    contributions["Group_C"] = {
+    "Group_C": {
         "Iris": [
-            {"date": base_date + timedelta(days=0, hours=10), "task": "UI Design", "action": "Created mockups", "duration_hours": 4},
-            {"date": base_date + timedelta(days=4, hours=14), "task": "UI Design", "action": "Refined design", "duration_hours": 2.5},
-            {"date": base_date + timedelta(days=8, hours=11), "task": "Frontend", "action": "Implemented UI", "duration_hours": 3},
+            (0, 10, "UI Design", "Created mockups", 4),
+            (4, 14, "UI Design", "Refined design", 2.5),
+            (8, 11, "Frontend", "Implemented UI", 3),
         ],
         "Jack": [
-            {"date": base_date + timedelta(days=1, hours=15), "task": "Backend Logic", "action": "Core logic", "duration_hours": 4},
-            {"date": base_date + timedelta(days=5, hours=10), "task": "API Integration", "action": "Connected API", "duration_hours": 3},
-            {"date": base_date + timedelta(days=10, hours=13), "task": "Testing", "action": "Unit tests", "duration_hours": 2},
+            (1, 15, "Backend Logic", "Core logic", 4),
+            (5, 10, "API Integration", "Connected API", 3),
+            (10, 13, "Testing", "Unit tests", 2),
         ],
         "Kate": [
-            {"date": base_date + timedelta(days=2, hours=14), "task": "Backend Logic", "action": "Database layer", "duration_hours": 3},
-            {"date": base_date + timedelta(days=6, hours=11), "task": "API Integration", "action": "Error handling", "duration_hours": 2},
-            {"date": base_date + timedelta(days=9, hours=15), "task": "Testing", "action": "Integration tests", "duration_hours": 2.5},
+            (2, 14, "Backend Logic", "Database layer", 3),
+            (6, 11, "API Integration", "Error handling", 2),
+            (9, 15, "Testing", "Integration tests", 2.5),
         ],
         "Liam": [
-            {"date": base_date + timedelta(days=3, hours=13), "task": "Testing", "action": "QA testing", "duration_hours": 2},
-            {"date": base_date + timedelta(days=7, hours=10), "task": "Documentation", "action": "API docs", "duration_hours": 3},
-            {"date": base_date + timedelta(days=11, hours=14), "task": "Documentation", "action": "User guide", "duration_hours": 2},
+            (3, 13, "Testing", "QA testing", 2),
+            (7, 10, "Documentation", "API docs", 3),
+            (11, 14, "Documentation", "User guide", 2),
         ]
     }
-    
-    return contributions
+}
+
+def _build_contributions(base_date):
+    return {
+        group_id: {
+            student: [
+                {"date": base_date + timedelta(days=day, hours=hour), "task": task,
+                 "action": action, "duration_hours": duration_hours}
+                for day, hour, task, action, duration_hours in events
+            ]
+            for student, events in students.items()
+        }
+        for group_id, students in CONTRIBUTION_EVENTS.items()
+    }
+
+# Dates are fixed once at import, relative to then, so the sample covers the last 2 weeks
+CONTRIBUTIONS = _build_contributions(datetime.now() - timedelta(days=14))
+
+def generate_contributions():
+    return CONTRIBUTIONS
 
 # Communication records
+COMMUNICATIONS = {
+    "Group_A": [
+        {"date": "2024-12-10", "from": "Alice", "to": "Diana", "message": "Diana, can you help with database setup?", "tone": "direct"},
+        {"date": "2024-12-11", "from": "Bob", "to": "Group", "message": "Need database schema ASAP", "tone": "urgent"},
+        {"date": "2024-12-12", "from": "Charlie", "to": "Alice", "message": "Schema done but backend might need tweaks", "tone": "informative"},
+    ],
+    "Group_B": [
+        {"date": "2024-12-10", "from": "Eve", "to": "Group", "message": "Data collected! Everyone please validate", "tone": "collaborative"},
+        {"date": "2024-12-11", "from": "Grace", "to": "Eve", "message": "Great work! I'll start analysis", "tone": "supportive"},
+    ],
+    "Group_C": [
+        {"date": "2024-12-10", "from": "Iris", "to": "Group", "message": "Mockups ready for feedback", "tone": "collaborative"},
+        {"date": "2024-12-11", "from": "Jack", "to": "Iris", "message": "Looks great! Starting backend development", "tone": "supportive"},
+    ]
+}
+
 def generate_communications():
-    communications = {
-        "Group_A": [
-            {"date": "2024-12-10", "from": "Alice", "to": "Diana", "message": "Diana, can you help with database setup?", "tone": "direct"},
-            {"date": "2024-12-11", "from": "Bob", "to": "Group", "message": "Need database schema ASAP", "tone": "urgent"},
-            {"date": "2024-12-12", "from": "Charlie", "to": "Alice", "message": "Schema done but backend might need tweaks", "tone": "informative"},
-        ],
-        "Group_B": [
-            {"date": "2024-12-10", "from": "Eve", "to": "Group", "message": "Data collected! Everyone please validate", "tone": "collaborative"},
-            {"date": "2024-12-11", "from": "Grace", "to": "Eve", "message": "Great work! I'll start analysis", "tone": "supportive"},
-        ],
-        "Group_C": [
-            {"date": "2024-12-10", "from": "Iris", "to": "Group", "message": "Mockups ready for feedback", "tone": "collaborative"},
-            {"date": "2024-12-11", "from": "Jack", "to": "Iris", "message": "Looks great! Starting backend development", "tone": "supportive"},
-        ]
-    }
-    return communications
+    return COMMUNICATIONS
 
 # Milestones
+MILESTONES = {
+    "Group_A": [
+        {"name": "Requirements Document", "due_date": "2024-11-30", "status": "Completed"},
+        {"name": "Design & Architecture", "due_date": "2024-12-05", "status": "Completed"},
+        {"name": "Core Features Implementation", "due_date": "2024-12-15", "status": "In Progress"},
+        {"name": "Testing & QA", "due_date": "2024-12-18", "status": "Not Started"},
+    ],
+    "Group_B": [
+        {"name": "Data Collection Plan", "due_date": "2024-12-02", "status": "Completed"},
+        {"name": "Raw Data Gathered", "due_date": "2024-12-08", "status": "Completed"},
+        {"name": "Analysis & Visualization", "due_date": "2024-12-15", "status": "In Progress"},
+        {"name": "Final Report & Presentation", "due_date": "2024-12-20", "status": "Not Started"},
+    ],
+    "Group_C": [
+        {"name": "Design Phase", "due_date": "2024-12-05", "status": "Completed"},
+        {"name": "Development Sprint 1", "due_date": "2024-12-12", "status": "Completed"},
+        {"name": "Development Sprint 2", "due_date": "2024-12-17", "status": "In Progress"},
+        {"name": "Deployment & Documentation", "due_date": "2024-12-20", "status": "Scheduled"},
+    ]
+}
+
 def generate_milestones():
-    milestones = {
-        "Group_A": [
-            {"name": "Requirements Document", "due_date": "2024-11-30", "status": "Completed"},
-            {"name": "Design & Architecture", "due_date": "2024-12-05", "status": "Completed"},
-            {"name": "Core Features Implementation", "due_date": "2024-12-15", "status": "In Progress"},
-            {"name": "Testing & QA", "due_date": "2024-12-18", "status": "Not Started"},
-        ],
-        "Group_B": [
-            {"name": "Data Collection Plan", "due_date": "2024-12-02", "status": "Completed"},
-            {"name": "Raw Data Gathered", "due_date": "2024-12-08", "status": "Completed"},
-            {"name": "Analysis & Visualization", "due_date": "2024-12-15", "status": "In Progress"},
-            {"name": "Final Report & Presentation", "due_date": "2024-12-20", "status": "Not Started"},
-        ],
-        "Group_C": [
-            {"name": "Design Phase", "due_date": "2024-12-05", "status": "Completed"},
-            {"name": "Development Sprint 1", "due_date": "2024-12-12", "status": "Completed"},
-            {"name": "Development Sprint 2", "due_date": "2024-12-17", "status": "In Progress"},
-            {"name": "Deployment & Documentation", "due_date": "2024-12-20", "status": "Scheduled"},
-        ]
-    }
-    return milestones
+    return MILESTONES
 
 # Generate all data
+@lru_cache(maxsize=1)
 def get_all_data():
+    """
+    Assemble the sample dataset once per process and return the same object on
+    every call. Callers must treat it as read-only (copy.deepcopy to modify).
+    """
     return {
         "groups": GROUPS,
         "contributions": generate_contributions(),